@@ -31,7 +31,7 @@ class TestConfiguration:
     format_options: Dict[InputFormat, FormatOption]
 
 
-@dataclass 
+@dataclass(slots=True)
 class ExtractionResult:
     """Result of text extraction for one configuration"""
     config_name: str
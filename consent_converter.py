@@ -18,6 +18,7 @@ import json
 import re
 import sys
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -30,7 +31,7 @@ from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
 from docling.pipeline.standard_pdf_pipeline import StandardPdfPipeline
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldInfo:
     """Information about a detected consent form field"""
     key: str
@@ -53,7 +54,11 @@ class ModentoSchemaValidator:
     VALID_INPUT_TYPES = {"name", "email", "phone", "number", "ssn", "zip", "initials"}
     VALID_DATE_TYPES = {"past", "future", "any"}
     
+    # Runs of characters that become a single underscore in key slugs
+    SLUG_SEPARATOR_RE = re.compile(r"[^a-zA-Z0-9]+")
+    
     @staticmethod
+    @lru_cache(maxsize=4096)
     def slugify(text: str, fallback: str = "field") -> str:
         """Convert text to a valid key slug"""
         if not text or not text.strip():
@@ -64,7 +69,7 @@ class ModentoSchemaValidator:
         text = "".join(ch for ch in text if not unicodedata.combining(ch))
         
         # Replace non-alphanumeric with underscores and lowercase
-        text = re.sub(r"[^a-zA-Z0-9]+", "_", text).strip("_").lower()
+        text = ModentoSchemaValidator.SLUG_SEPARATOR_RE.sub("_", text).strip("_").lower()
         
         return text or fallback
     
@@ -73,13 +78,19 @@ class ModentoSchemaValidator:
         """Ensure all keys are globally unique"""
         seen = set()
         
+        seen_add = seen.add
+        
         def make_unique(key: str) -> str:
+            # Fast path: most keys are already unique
+            if key not in seen:
+                seen_add(key)
+                return key
             base = key
             counter = 2
             while key in seen:
                 key = f"{base}_{counter}"
                 counter += 1
-            seen.add(key)
+            seen_add(key)
             return key
         
         for item in spec:
@@ -149,23 +160,46 @@ class ConsentShapingManager:
     
     # Patterns that indicate consent paragraph content
     CONSENT_PATTERNS = [
-        r'.*I understand.*',
-        r'.*I acknowledge.*',
-        r'.*I agree.*',
-        r'.*I consent.*',
-        r'.*I authorize.*',
-        r'.*I have been.*informed.*',
-        r'.*risks.*benefits.*',
-        r'.*alternative.*treatment.*',
-        r'.*financial.*responsibility.*',
-        r'.*informed.*consent.*',
+        r'I understand',
+        r'I acknowledge',
+        r'I agree',
+        r'I consent',
+        r'I authorize',
+        r'I have been.*informed',
+        r'risks.*benefits',
+        r'alternative.*treatment',
+        r'financial.*responsibility',
+        r'informed.*consent',
     ]
+    # All consent patterns as one alternation, so a text is scanned once
+    CONSENT_PATTERN_RE = re.compile('|'.join(CONSENT_PATTERNS), re.IGNORECASE)
+    
+    # Keywords counted by consent-content detection; two or more mark consent content
+    CONSENT_KEYWORDS = (
+        'consent', 'acknowledge', 'understand', 'agree', 'authorize',
+        'risks', 'benefits', 'complications', 'treatment', 'procedure'
+    )
+    
+    # Line markers for detect_consent_sections ('sign' also covers 'signature' and 'date signed')
+    PATIENT_INFO_MARKER_RE = re.compile(r'patient name|name:|patient info')
+    PROCEDURE_MARKER_RE = re.compile(r'procedure|treatment|surgery')
+    
+    # Whitespace and punctuation fixes applied by format_consent_text
+    WHITESPACE_RUN_RE = re.compile(r'\s+')
+    SENTENCE_GAP_RE = re.compile(r'\.(\w)')
+    SPACE_BEFORE_PUNCTUATION_RE = re.compile(r'\s+([,.;:!?])')
+    
+    # Words that stay lowercase in title case (except as the first word)
+    TITLE_CASE_LOWERCASE_WORDS = frozenset({
+        'a', 'an', 'and', 'as', 'at', 'but', 'by', 'for', 'in', 'of', 'on', 'or', 'the', 'to', 'with'
+    })
     
     def __init__(self):
         """Initialize the consent shaping manager"""
-        self.compiled_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.CONSENT_PATTERNS]
+        pass
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def to_title_case(text: str) -> str:
         """Convert text to proper title case for section names
         
@@ -178,9 +212,6 @@ class ConsentShapingManager:
         if not text:
             return text
         
-        # Words that should remain lowercase in title case (except at start)
-        lowercase_words = {'a', 'an', 'and', 'as', 'at', 'but', 'by', 'for', 'in', 'of', 'on', 'or', 'the', 'to', 'with'}
-        
         words = text.split()
         result = []
         
@@ -194,7 +225,7 @@ class ConsentShapingManager:
             elif i == 0 or word[0] in '("':
                 result.append(word.capitalize())
             # Keep lowercase words lowercase unless they're the first word
-            elif word.lower() in lowercase_words:
+            elif word.lower() in ConsentShapingManager.TITLE_CASE_LOWERCASE_WORDS:
                 result.append(word.lower())
             # All other words should be capitalized
             else:
@@ -208,18 +239,12 @@ class ConsentShapingManager:
             return False
         
         # Check against consent patterns
-        for pattern in self.compiled_patterns:
-            if pattern.search(text):
-                return True
+        if self.CONSENT_PATTERN_RE.search(text):
+            return True
         
         # Additional checks for consent keywords
-        consent_keywords = [
-            'consent', 'acknowledge', 'understand', 'agree', 'authorize',
-            'risks', 'benefits', 'complications', 'treatment', 'procedure'
-        ]
-        
         text_lower = text.lower()
-        keyword_count = sum(1 for keyword in consent_keywords if keyword in text_lower)
+        keyword_count = sum(1 for keyword in self.CONSENT_KEYWORDS if keyword in text_lower)
         
         # If multiple consent keywords are present, likely consent content
         return keyword_count >= 2
@@ -231,13 +256,13 @@ class ConsentShapingManager:
         
         # Clean up common formatting issues in consent text
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = self.WHITESPACE_RUN_RE.sub(' ', text).strip()
         
         # Ensure proper sentence spacing
-        text = re.sub(r'\.(\w)', r'. \1', text)
+        text = self.SENTENCE_GAP_RE.sub(r'. \1', text)
         
         # Fix common punctuation issues
-        text = re.sub(r'\s+([,.;:!?])', r'\1', text)
+        text = self.SPACE_BEFORE_PUNCTUATION_RE.sub(r'\1', text)
         
         return text
     
@@ -261,15 +286,15 @@ class ConsentShapingManager:
                 })
             
             # Detect signature section
-            if any(word in line_lower for word in ['signature', 'sign', 'date signed']):
+            if 'sign' in line_lower:
                 sections['signature_section'] = True
             
             # Detect patient information section
-            if any(word in line_lower for word in ['patient name', 'name:', 'patient info']):
+            if self.PATIENT_INFO_MARKER_RE.search(line_lower):
                 sections['patient_info_section'] = True
             
             # Detect procedure section
-            if any(word in line_lower for word in ['procedure', 'treatment', 'surgery']):
+            if self.PROCEDURE_MARKER_RE.search(line_lower):
                 sections['procedure_section'] = True
         
         return sections
@@ -278,6 +303,9 @@ class ConsentShapingManager:
 class HeaderFooterManager:
     """Manages universal header/footer removal for consent documents"""
     
+    # Substrings (matched on the lowercased line) that mark practice contact lines
+    PRACTICE_MARKERS = ('www.', '@', 'route', 'office:', 'phone:', 'fax:')
+    
     def __init__(self):
         """Initialize the header/footer manager"""
         # Patterns for practice information that should be removed
@@ -293,19 +321,14 @@ class HeaderFooterManager:
     
     def is_practice_information(self, line: str) -> bool:
         """Check if a line contains practice information that should be removed"""
-        line_lower = line.lower().strip()
-        
         # Check against compiled patterns
         for pattern in self.compiled_practice_patterns:
             if pattern.search(line):
                 return True
         
-        # Check for specific practice info markers
-        practice_markers = [
-            'www.', '@', 'route', 'office:', 'phone:', 'fax:'
-        ]
-        
-        return any(marker in line_lower for marker in practice_markers)
+        # Check for specific practice info markers (no marker has edge whitespace, so no strip is needed)
+        line_lower = line.lower()
+        return any(marker in line_lower for marker in self.PRACTICE_MARKERS)
     
     def remove_practice_headers_footers(self, text_lines: List[str]) -> List[str]:
         """Remove practice headers/footers from consent forms"""
@@ -324,6 +347,141 @@ class HeaderFooterManager:
 class ConsentFormFieldExtractor:
     """Extract form fields from consent PDFs and DOCX documents"""
     
+    # Title shapes for the first consent line, tried in order; the named group that
+    # matched (Match.lastgroup) tells which one it was
+    CONSENT_TITLE_LINE_RE = re.compile(
+        r'(?P<caps>[A-Z\s]+CONSENT[A-Z\s]*$)'
+        r'|(?P<informed_for>(?i:Informed\s+Consent\s+for\s+))'
+        r'|(?P<bold>\*\*(?P<bold_text>.+)\*\*$)'
+        r'|(?P<informed>(?i:.+\s+Informed\s+Consent\s*$))'
+        r'|(?P<refusal>(?i:.+\s+[Rr]efusal\s*$))'
+    )
+    
+    # Lines dropped from consent content and signature fields, matched on the lowercased line:
+    # witness fields, doctor/provider and parent/guardian signatures, "patient/parent/guardian"
+    # lines and "legally authorized representative"
+    EXCLUDED_SIGNATURE_LINE_INDICATORS = (
+        'witness signature', 'witness printed name', 'witness name', 'witness date',
+        'witnessed by', 'witness:', 'witness relationship', "witness's", 'witness\u2019s',
+        'doctor signature', 'dentist signature', 'physician signature',
+        'dr. signature', 'practitioner signature', 'provider signature',
+        'clinician signature', "doctor's", 'doctor\u2019s',
+        'parent signature', 'guardian signature', 'parent\u2019s signature',
+        "parent's signature", 'guardian\u2019s signature', "guardian's signature",
+        'legal guardian\u2019s', "legal guardian's",
+        'patient/parent/guardian', 'legally authorized representative',
+    )
+    EXCLUDED_SIGNATURE_LINE_RE = re.compile('|'.join(map(re.escape, EXCLUDED_SIGNATURE_LINE_INDICATORS)))
+    
+    # Parent/guardian name lines, extracted as separate fields rather than kept in HTML content
+    PARENT_GUARDIAN_NAME_RE = re.compile('|'.join(map(re.escape, (
+        'parent\u2019s name', "parent's name", 'guardian\u2019s name', "guardian's name",
+        'parent/guardian\u2019s name', "parent/guardian's name"
+    ))))
+    
+    # Lines that start the signature section (matched on the lowercased line)
+    SIGNATURE_SECTION_START_RE = re.compile(r'signature\s*:|patient\s+signature|parent.*name\s*:|guardian.*name\s*:')
+    
+    # Signature-area field rules, tried in order on each line (more specific patterns first):
+    # (pattern, key, title, field_type, control); controls are copied per field
+    CONSENT_SIGNATURE_FIELD_RULES = (
+        (re.compile(r'Printed?\s+[Nn]ame\s+if\s+signed\s+on\s+behalf', re.IGNORECASE), 'printed_name_if_signed_on_behalf', 'Printed name if signed on behalf of the patient', 'input', {'input_type': None, 'hint': None}),
+        (re.compile(r"Parent/Guardian['\u2019]s\s+Name\s*:", re.IGNORECASE), 'parent_guardian_name', 'Parent/Guardian Name', 'input', {'input_type': 'name', 'hint': None}),
+        (re.compile(r'Patient.*Name.*Print', re.IGNORECASE), 'patient_name_print', 'Patient Name (Print)', 'input', {'input_type': 'name', 'hint': None}),
+        (re.compile(r'Relationship\s*_+', re.IGNORECASE), 'relationship', 'Relationship', 'input', {'input_type': 'name', 'hint': None}),
+        (re.compile(r'Date\s+of\s+Birth', re.IGNORECASE), 'date_of_birth', 'Date of Birth', 'date', {'input_type': 'past', 'hint': None}),
+        (re.compile(r'tooth\s+no(?:mber)?\.?\s*[:\(]?\s*_+', re.IGNORECASE), 'tooth_number', 'Tooth Number', 'input', {'input_type': 'name', 'hint': None}),
+        (re.compile(r'procedure.*follows?', re.IGNORECASE), 'procedure_description', 'Procedure Description', 'input', {'input_type': 'name', 'hint': None}),
+        (re.compile(r'alternative.*treatment', re.IGNORECASE), 'alternative_treatment', 'Alternative Treatment', 'input', {'input_type': 'name', 'hint': None}),
+    )
+    
+    # Placeholder substitutions applied in order to consent HTML after the provider patterns;
+    # the underscore forms run first so the bare-label forms skip already replaced text
+    PLACEHOLDER_SUBSTITUTIONS = (
+        # Common Dr. blank patterns
+        (re.compile(r'Dr\.\s+_+', re.IGNORECASE), 'Dr. {{provider}}'),
+        # Replace tooth number/site placeholders - match various patterns with or without underscores
+        # Pattern: "Tooth Number: ___" with underscores first (most specific)
+        (re.compile(r'Tooth\s+Number\s*:\s*_+', re.IGNORECASE), 'Tooth Number: {{tooth_or_site}}'),
+        # Pattern: "Tooth Number:" without underscores (avoid replacing already replaced text)
+        (re.compile(r'Tooth\s+Number\s*:(?!\s*\{\{)', re.IGNORECASE), 'Tooth Number: {{tooth_or_site}}'),
+        # Pattern: "Tooth No(s). ___" with underscores
+        (re.compile(r'Tooth\s+No\(s\)\.\s+_+', re.IGNORECASE), 'Tooth No(s). {{tooth_or_site}}'),
+        # Pattern: "Tooth No. ___" with underscores
+        (re.compile(r'Tooth\s+No\.\s*:\s*_+', re.IGNORECASE), 'Tooth No.: {{tooth_or_site}}'),
+        # Pattern: "Tooth #: ___" with underscores
+        (re.compile(r'Tooth\s*#\s*:\s*_+', re.IGNORECASE), 'Tooth #: {{tooth_or_site}}'),
+        # Replace patient name placeholders - match various patterns with or without underscores
+        # Pattern: "Patient name: ___" with underscores first (most specific)
+        (re.compile(r'Patient\s+[Nn]ame\s*:\s*_+', re.IGNORECASE), 'Patient Name: {{patient_name}}'),
+        # Pattern: "Patient Name:" without underscores (avoid replacing already replaced text)
+        (re.compile(r'Patient\s+[Nn]ame\s*:(?!\s*\{\{)', re.IGNORECASE), 'Patient Name: {{patient_name}}'),
+        # Pattern: "Patient's Name:" (with apostrophe-s) - match with or without underscores/tabs
+        (re.compile(r"Patient['\u2019]s\s+Name\s*:\s*[\s\t_]*", re.IGNORECASE), 'Patient\'s Name: {{patient_name}}'),
+        (re.compile(r"Patient['\u2019]s\s+Name\s*:(?!\s*\{\{)", re.IGNORECASE), 'Patient\'s Name: {{patient_name}}'),
+        # Pattern: "I, _____(print name)" or similar variations
+        (re.compile(r'\b[Ii],?\s+_+\s*\(?\s*print\s+name\s*\)?', re.IGNORECASE), 'I, {{patient_name}} (print name)'),
+        # Replace DOB placeholders - match various patterns with or without underscores
+        # Pattern: "DOB: ___" with underscores first (most specific)
+        (re.compile(r'DOB\s*:\s*_+', re.IGNORECASE), 'DOB: {{patient_dob}}'),
+        # Pattern: "DOB:" without underscores (avoid replacing already replaced text)
+        (re.compile(r'DOB\s*:(?!\s*\{\{)', re.IGNORECASE), 'DOB: {{patient_dob}}'),
+        # Replace Date of Birth placeholders - match various patterns with or without underscores
+        # Pattern: "Date of Birth: ___" with underscores first (most specific)
+        (re.compile(r'Date\s+of\s+Birth\s*:\s*_+', re.IGNORECASE), 'Date of Birth: {{patient_dob}}'),
+        # Pattern: "Date of Birth:" without underscores (avoid replacing already replaced text)
+        (re.compile(r'Date\s+of\s+Birth\s*:(?!\s*\{\{)', re.IGNORECASE), 'Date of Birth: {{patient_dob}}'),
+        # Replace Planned Procedure placeholders - match various patterns with or without underscores
+        # Pattern: "Planned Procedure: ___" with underscores first (most specific)
+        (re.compile(r'Planned\s+Procedure\s*:\s*_+', re.IGNORECASE), 'Planned Procedure: {{planned_procedure}}'),
+        # Pattern: "Planned Procedure:" without underscores (avoid replacing already replaced text)
+        (re.compile(r'Planned\s+Procedure\s*:(?!\s*\{\{)', re.IGNORECASE), 'Planned Procedure: {{planned_procedure}}'),
+        # Replace Diagnosis placeholders - match various patterns with or without underscores
+        # Pattern: "Diagnosis: ___" with underscores first (most specific)
+        (re.compile(r'Diagnosis\s*:\s*_+', re.IGNORECASE), 'Diagnosis: {{diagnosis}}'),
+        # Pattern: "Diagnosis:" without underscores (avoid replacing already replaced text)
+        (re.compile(r'Diagnosis\s*:(?!\s*\{\{)', re.IGNORECASE), 'Diagnosis: {{diagnosis}}'),
+        # Replace Alternative Treatment placeholders - match various patterns with or without underscores
+        # Pattern: "Alternative Treatment: ___" with underscores first (most specific)
+        (re.compile(r'Alternative\s+Treatment\s*:\s*_+', re.IGNORECASE), 'Alternative Treatment: {{alternative_treatment}}'),
+        # Pattern: "Alternative Treatment:" without underscores (avoid replacing already replaced text)
+        (re.compile(r'Alternative\s+Treatment\s*:(?!\s*\{\{)', re.IGNORECASE), 'Alternative Treatment: {{alternative_treatment}}'),
+        # Replace standalone Date placeholders (not Date of Birth or Date Signed)
+        # Pattern: "Date: ___" with underscores first (most specific)
+        (re.compile(r'(?<!of\s)(?<!Birth\s)(?<!Signed\s)Date\s*:\s*_+', re.IGNORECASE), 'Date: {{today_date}}'),
+        # Pattern: "Date:" without underscores (avoid replacing already replaced text and Date of Birth/Date Signed)
+        (re.compile(r'(?<!of\s)(?<!Birth\s)(?<!Signed\s)Date\s*:(?!\s*\{\{)', re.IGNORECASE), 'Date: {{today_date}}'),
+    )
+    
+    # Practice website/email/phone/address details stripped from consent content
+    PRACTICE_INFO_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'www\.\w+\.com',
+        r'\w+@\w+\.com',
+        r'\(\d{3}\)\d{3}-?\d{4}',
+        r'\d+\s+[A-Z][A-Za-z\s]+,\s+[A-Z]{2}\s+\d{5}',
+        r'Route\s+\d+.*\d{5}',
+        r'Smile@.*\.com',
+    ))
+    
+    # Consent title shapes searched in the joined content, most specific first
+    CONSENT_TITLE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'Informed\s+Consent\s+for\s+([^.]+)',
+        r'Consent\s+for\s+([^.]+)',
+        r'([^.]*Consent[^.]*)',
+    ))
+    
+    # Markdown cleanup for consent lines
+    EMPTY_MARKDOWN_HEADER_RE = re.compile(r'^#+\s*$')
+    MARKDOWN_H3_RE = re.compile(r'^###\s+(.+)$')
+    MARKDOWN_H2_RE = re.compile(r'^##\s+(.+)$')
+    MARKDOWN_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+    MARKDOWN_HASH_RUN_RE = re.compile(r'\s*#+\s*')
+    
+    # Shared text helpers: HTML tags, whitespace runs and paragraph boundaries
+    HTML_TAG_RE = re.compile(r'<[^>]+>')
+    WHITESPACE_RUN_RE = re.compile(r'\s+')
+    PARAGRAPH_BREAK_RE = re.compile(r'(?:\.\s+|\n\s*\n)')
+    
     def __init__(self):
         """Initialize the extractor with Docling"""
         # Setup Docling converter with optimized settings
@@ -444,19 +602,6 @@ class ConsentFormFieldExtractor:
             r'authorize\s+Dr\.',
         ]
         
-        # Universal field patterns for consent forms
-        # Order matters - more specific patterns first
-        field_patterns = [
-            (r'Printed?\s+[Nn]ame\s+if\s+signed\s+on\s+behalf', 'printed_name_if_signed_on_behalf', 'Printed name if signed on behalf of the patient', 'input', {'input_type': None, 'hint': None}),
-            (r"Parent/Guardian['\u2019]s\s+Name\s*:", 'parent_guardian_name', 'Parent/Guardian Name', 'input', {'input_type': 'name', 'hint': None}),
-            (r'Patient.*Name.*Print', 'patient_name_print', 'Patient Name (Print)', 'input', {'input_type': 'name', 'hint': None}),
-            (r'Relationship\s*_+', 'relationship', 'Relationship', 'input', {'input_type': 'name', 'hint': None}),
-            (r'Date\s+of\s+Birth', 'date_of_birth', 'Date of Birth', 'date', {'input_type': 'past', 'hint': None}),
-            (r'tooth\s+no(?:mber)?\.?\s*[:\(]?\s*_+', 'tooth_number', 'Tooth Number', 'input', {'input_type': 'name', 'hint': None}),
-            (r'procedure.*follows?', 'procedure_description', 'Procedure Description', 'input', {'input_type': 'name', 'hint': None}),
-            (r'alternative.*treatment', 'alternative_treatment', 'Alternative Treatment', 'input', {'input_type': 'name', 'hint': None}),
-        ]
-        
         # EXTRACT MAIN CONSENT TEXT BLOCK
         consent_text_lines = []
         signature_start_idx = None
@@ -465,10 +610,7 @@ class ConsentFormFieldExtractor:
             line_lower = line.lower()
             # Look for signature section markers - be more specific to avoid false positives
             # Also recognize parent/guardian name as a signature section marker
-            if (re.search(r'signature\s*:', line_lower) or 
-                re.search(r'patient\s+signature', line_lower) or
-                re.search(r'parent.*name\s*:', line_lower) or
-                re.search(r'guardian.*name\s*:', line_lower)):
+            if self.SIGNATURE_SECTION_START_RE.search(line_lower):
                 signature_start_idx = i
                 break
             elif line.strip():
@@ -518,8 +660,8 @@ class ConsentFormFieldExtractor:
                     continue
                 
                 # Apply field patterns
-                for pattern, key, title, field_type, control in field_patterns:
-                    if re.search(pattern, line, re.IGNORECASE) and key not in processed_keys:
+                for pattern, key, title, field_type, control in self.CONSENT_SIGNATURE_FIELD_RULES:
+                    if key not in processed_keys and pattern.search(line):
                         # Skip witness fields per Modento schema rule (double check)
                         if 'witness' in key.lower() or 'doctor' in key.lower():
                             continue
@@ -530,7 +672,7 @@ class ConsentFormFieldExtractor:
                             field_type=field_type,
                             section=current_section,
                             optional=False,
-                            control=control,
+                            control=dict(control),
                             line_idx=signature_start_idx + i
                         )
                         fields.append(field)
@@ -590,14 +732,14 @@ class ConsentFormFieldExtractor:
                        and f != signature_field 
                        and f != date_signed_field]
         
-        # Build ordered list
-        reordered_fields = form_fields + primary_input_fields
-        if signature_field:
-            reordered_fields.append(signature_field)
-        if date_signed_field:
-            reordered_fields.append(date_signed_field)
-        reordered_fields.extend(secondary_input_fields)
-        reordered_fields.extend(other_fields)
+        # Build ordered list in a single allocation
+        reordered_fields = [
+            *form_fields,
+            *primary_input_fields,
+            *(f for f in (signature_field, date_signed_field) if f),
+            *secondary_input_fields,
+            *other_fields,
+        ]
         
         fields = reordered_fields
         
@@ -613,61 +755,13 @@ class ConsentFormFieldExtractor:
         """
         
         # UNIVERSAL WITNESS FIELD EXCLUSION: Per requirements, we do not allow witnesses on forms or consents
-        
-        # Witness field indicators - these should be filtered out universally
-        witness_indicators = [
-            'witness signature', 'witness printed name', 'witness name', 'witness date',
-            'witnessed by', 'witness:', 'witness relationship', "witness's", 'witness\u2019s'
-        ]
-        
-        # Doctor/dentist signature indicators - these are typically not patient-facing fields
-        doctor_signatures = [
-            'doctor signature', 'dentist signature', 'physician signature',
-            'dr. signature', 'practitioner signature', 'provider signature', 
-            'clinician signature', "doctor's", 'doctor\u2019s'
-        ]
-        
-        # Parent/Guardian signature indicators - these are typically not patient-facing fields
-        parent_guardian_signatures = [
-            'parent signature', 'guardian signature', 'parent\u2019s signature', 
-            "parent's signature", 'guardian\u2019s signature', "guardian's signature",
-            'legal guardian\u2019s', "legal guardian's"
-        ]
-        
-        # Parent/Guardian name indicators - these should be extracted as separate fields, not in HTML content
-        parent_guardian_names = [
-            'parent\u2019s name', "parent's name", 'guardian\u2019s name', "guardian's name",
-            'parent/guardian\u2019s name', "parent/guardian's name"
-        ]
-        
-        # Filter out witness fields universally
-        for indicator in witness_indicators:
-            if indicator in line_lower:
-                return True
-        
-        # Filter out clear doctor/provider signatures
-        for indicator in doctor_signatures:
-            if indicator in line_lower:
-                return True
-        
-        # Filter out parent/guardian signatures
-        for indicator in parent_guardian_signatures:
-            if indicator in line_lower:
-                return True
+        # Witness, doctor/provider and parent/guardian signature lines are filtered out universally
+        if self.EXCLUDED_SIGNATURE_LINE_RE.search(line_lower):
+            return True
         
         # Filter out parent/guardian names only when filter_parent_guardian_names is True
         # (e.g., when filtering HTML content, but not when extracting signature fields)
-        if filter_parent_guardian_names:
-            for indicator in parent_guardian_names:
-                if indicator in line_lower:
-                    return True
-        
-        # Filter lines mentioning "patient/parent/guardian" signature or name fields
-        if 'patient/parent/guardian' in line_lower:
-            return True
-        
-        # Special handling: "legally authorized representative" - filter if witness-related
-        if 'legally authorized representative' in line_lower:
+        if filter_parent_guardian_names and self.PARENT_GUARDIAN_NAME_RE.search(line_lower):
             return True
         
         # Check for printed name in context of witness/representative - filter these out
@@ -678,7 +772,7 @@ class ConsentFormFieldExtractor:
         
         # Filter lines that are mostly or entirely underscores (signature lines)
         # Strip HTML tags first to check the actual content
-        text_only = re.sub(r'<[^>]+>', '', line_lower).strip()
+        text_only = self._strip_html_tags(line_lower).strip()
         if text_only and len(text_only) >= 10:  # Only check if there's substantial content
             underscore_count = text_only.count('_')
             if underscore_count >= 10 and underscore_count / len(text_only) > 0.7:
@@ -686,23 +780,22 @@ class ConsentFormFieldExtractor:
             
         return False
     
+    @classmethod
+    def _strip_html_tags(cls, text: str) -> str:
+        """Remove HTML tags from text; most consent lines carry none, so the regex only runs when '<' is present"""
+        return cls.HTML_TAG_RE.sub('', text) if '<' in text else text
+    
     def _remove_witness_and_doctor_signatures(self, content: str) -> str:
         """Remove witness and doctor signature text from HTML content"""
         
-        # Split content into lines for processing
-        lines = content.split('<br>')
-        filtered_lines = []
-        
-        for line in lines:
-            # Strip HTML tags to check content
-            text_content = re.sub(r'<[^>]+>', '', line).strip()
-            
-            # Skip lines that contain witness or doctor signature patterns
-            if text_content and not self._is_witness_or_doctor_signature_field(text_content.lower()):
-                filtered_lines.append(line)
-        
-        # Rejoin the filtered lines
-        return '<br>'.join(filtered_lines)
+        # Stream the <br>-separated lines straight into the rejoin, keeping only the lines to show
+        return '<br>'.join(line for line in content.split('<br>') if self._is_displayable_content_line(line))
+    
+    def _is_displayable_content_line(self, line: str) -> bool:
+        """Check that an HTML content line has text and is not a witness or doctor signature line"""
+        # Strip HTML tags to check content
+        text_content = self._strip_html_tags(line).strip()
+        return bool(text_content) and not self._is_witness_or_doctor_signature_field(text_content.lower())
     
     def _create_enhanced_consent_html(self, consent_text_lines: List[str], full_text: str, provider_patterns: List[str], bold_lines: Optional[Dict[str, bool]] = None) -> Tuple[str, Optional[str]]:
         """Create properly formatted HTML content for consent forms with provider placeholders
@@ -722,11 +815,14 @@ class ConsentFormFieldExtractor:
         
         # Extract title from first line if it's a header
         title = None
-        content_lines = consent_text_lines.copy()
         
-        # First, filter out any empty header lines (standalone # or ## or ###)
-        while content_lines and re.match(r'^#+\s*$', content_lines[0]):
-            content_lines = content_lines[1:]
+        # First, filter out any empty header lines (standalone # or ## or ###).
+        # content_lines is only ever re-sliced, never mutated, so one slice replaces the defensive copy
+        start = 0
+        while (start < len(consent_text_lines) and consent_text_lines[start].startswith('#')
+               and not consent_text_lines[start].rstrip().strip('#')):
+            start += 1
+        content_lines = consent_text_lines[start:]
         
         if not content_lines:
             # If all lines were empty headers, return empty
@@ -741,53 +837,61 @@ class ConsentFormFieldExtractor:
             # Match double ## markdown header
             title = content_lines[0].replace('## ', '').strip()
             content_lines = content_lines[1:]  # Remove title from content
-        elif content_lines and re.match(r'^[A-Z\s]+CONSENT[A-Z\s]*$', content_lines[0]):
-            # Match all caps titles like "TOOTH REMOVAL CONSENT FORM"
-            title = content_lines[0].strip()
-            content_lines = content_lines[1:]
-        elif content_lines and re.match(r'^Informed\s+Consent\s+for\s+', content_lines[0], re.IGNORECASE):
-            # Match titles like "Informed Consent for Crown And Bridge Prosthetics"
-            title = content_lines[0].strip()
-            content_lines = content_lines[1:]
-        elif content_lines and re.match(r'^\*\*(.+)\*\*$', content_lines[0]):
-            # Match bold markdown titles like "**Olympia Hills Family Dental Warranty Document**"
-            match = re.match(r'^\*\*(.+)\*\*$', content_lines[0])
-            if match and len(match.group(1)) < 150:  # Reasonable title length
-                title = match.group(1).strip()
-                content_lines = content_lines[1:]  # Remove title from content
-        elif content_lines and re.match(r'^.+\s+Informed\s+Consent\s*$', content_lines[0], re.IGNORECASE):
-            # Match titles like "Labial Frenectomy Informed Consent" (ending with "Informed Consent")
-            if len(content_lines[0].strip()) < 150:  # Reasonable title length
-                title = content_lines[0].strip()
-                content_lines = content_lines[1:]  # Remove title from content
-        elif content_lines and re.match(r'^.+\s+[Rr]efusal\s*$', content_lines[0], re.IGNORECASE):
-            # Match titles ending with "refusal" (e.g., "Informed refusal of necessary x-rays")
-            if len(content_lines[0].strip()) < 150:  # Reasonable title length
+        else:
+            # One pass over the first line decides which title shape (if any) it has
+            title_match = self.CONSENT_TITLE_LINE_RE.match(content_lines[0])
+            title_shape = title_match.lastgroup if title_match else None
+            if title_shape in ('caps', 'informed_for'):
+                # All caps titles like "TOOTH REMOVAL CONSENT FORM", or titles like
+                # "Informed Consent for Crown And Bridge Prosthetics"
                 title = content_lines[0].strip()
-                content_lines = content_lines[1:]  # Remove title from content
+                content_lines = content_lines[1:]
+            elif title_shape == 'bold':
+                # Bold markdown titles like "**Olympia Hills Family Dental Warranty Document**"
+                bold_text = title_match.group('bold_text')
+                if len(bold_text) < 150:  # Reasonable title length
+                    title = bold_text.strip()
+                    content_lines = content_lines[1:]  # Remove title from content
+            elif title_shape in ('informed', 'refusal'):
+                # Titles ending with "Informed Consent" (e.g., "Labial Frenectomy Informed Consent")
+                # or "refusal" (e.g., "Informed refusal of necessary x-rays")
+                if len(content_lines[0].strip()) < 150:  # Reasonable title length
+                    title = content_lines[0].strip()
+                    content_lines = content_lines[1:]  # Remove title from content
+        
+        # Process content to handle bullet points and structure, joining the output as it is
+        # produced: pieces are separated by <br> except around list markup (<ul>, </ul>, <li>)
+        content_parts = []
+        prev_piece = None
+        
+        def emit(piece: str):
+            nonlocal prev_piece
+            if prev_piece is not None and not (piece.startswith(('<ul>', '</ul>', '<li>')) or
+                                               piece.endswith('</li>') or
+                                               prev_piece.startswith(('<ul>', '</ul>'))):
+                content_parts.append('<br>')
+            content_parts.append(piece)
+            prev_piece = piece
         
-        # Process content to handle bullet points and structure
-        processed_lines = []
         in_bullet_list = False
         prev_line_was_bold_subheader = False
         
         for line in content_lines:
             if not line.strip():
                 if in_bullet_list:
-                    processed_lines.append('</ul>')
+                    emit('</ul>')
                     in_bullet_list = False
                 continue
             
-            # Clean markdown formatting from the line before processing
-            line = self._clean_markdown_formatting(line)
+            # Clean markdown formatting from the line before processing (the result is already stripped)
+            line_text = self._clean_markdown_formatting(line)
+            is_bullet = self._is_bullet_line(line_text)
             
             # Check if this line is a bold subheader from DOCX
             is_bold_subheader = False
-            line_text = line.strip()
-            if line_text in bold_lines and bold_lines[line_text]:
+            if bold_lines.get(line_text):
                 # This is a bold line from DOCX - check if it's likely a subheader
                 # Subheaders are typically short (< 100 chars), not bullet points, and not field labels
-                is_bullet = re.match(r'^[-•\uf0b7]\s+', line_text)
                 has_underscores = '_' in line_text
                 is_short = len(line_text) < 100
                 
@@ -795,45 +899,36 @@ class ConsentFormFieldExtractor:
                     is_bold_subheader = True
             
             # Add spacing before bold subheaders (except if it's the first line or follows another subheader)
-            if is_bold_subheader and processed_lines and not prev_line_was_bold_subheader:
+            if is_bold_subheader and content_parts and not prev_line_was_bold_subheader:
                 # Add extra spacing before subheader
-                processed_lines.append('<br>')
+                emit('<br>')
             
             # Check if line is a bullet point (starts with - or \uf0b7 or bullet marker)
-            if re.match(r'^[-•\uf0b7]\s+', line.strip()):
+            if is_bullet:
                 if not in_bullet_list:
-                    processed_lines.append('<ul>')
+                    emit('<ul>')
                     in_bullet_list = True
                 # Remove bullet marker and add as list item, also clean \uf0b7 from within the text
-                clean_line = re.sub(r'^[-•\uf0b7]\s+', '', line.strip())
-                clean_line = clean_line.replace('\uf0b7', '').strip()
-                processed_lines.append(f'<li>{clean_line}</li>')
+                clean_line = line_text[1:].replace('\uf0b7', '').strip()
+                emit(f'<li>{clean_line}</li>')
                 prev_line_was_bold_subheader = False
             else:
                 if in_bullet_list:
-                    processed_lines.append('</ul>')
+                    emit('</ul>')
                     in_bullet_list = False
                 
                 # Apply bold formatting to subheaders
                 if is_bold_subheader:
-                    processed_lines.append(f'<strong>{line.strip()}</strong>')
+                    emit(f'<strong>{line_text}</strong>')
                     prev_line_was_bold_subheader = True
                 else:
-                    processed_lines.append(line.strip())
+                    emit(line_text)
                     prev_line_was_bold_subheader = False
         
         # Close bullet list if still open
         if in_bullet_list:
-            processed_lines.append('</ul>')
+            emit('</ul>')
         
-        # Join content - avoid extra <br> tags around <ul> tags
-        content_parts = []
-        for i, line in enumerate(processed_lines):
-            if i > 0 and not (line.startswith('<ul>') or line.startswith('</ul>') or 
-                             processed_lines[i-1].startswith('<ul>') or processed_lines[i-1].startswith('</ul>') or
-                             line.startswith('<li>') or line.endswith('</li>')):
-                content_parts.append('<br>')
-            content_parts.append(line)
         content = ''.join(content_parts)
         
         # Remove practice header/footer information
@@ -843,69 +938,9 @@ class ConsentFormFieldExtractor:
         for pattern in provider_patterns:
             content = re.sub(pattern, '{{provider}}', content, flags=re.IGNORECASE)
         
-        # Also replace common Dr. blank patterns
-        content = re.sub(r'Dr\.\s+_+', 'Dr. {{provider}}', content, flags=re.IGNORECASE)
-        
-        # Replace tooth number/site placeholders - match various patterns with or without underscores
-        # Pattern: "Tooth Number: ___" with underscores first (most specific)
-        content = re.sub(r'Tooth\s+Number\s*:\s*_+', 'Tooth Number: {{tooth_or_site}}', content, flags=re.IGNORECASE)
-        # Pattern: "Tooth Number:" without underscores (avoid replacing already replaced text)
-        content = re.sub(r'Tooth\s+Number\s*:(?!\s*\{\{)', 'Tooth Number: {{tooth_or_site}}', content, flags=re.IGNORECASE)
-        
-        # Pattern: "Tooth No(s). ___" with underscores
-        content = re.sub(r'Tooth\s+No\(s\)\.\s+_+', 'Tooth No(s). {{tooth_or_site}}', content, flags=re.IGNORECASE)
-        # Pattern: "Tooth No. ___" with underscores
-        content = re.sub(r'Tooth\s+No\.\s*:\s*_+', 'Tooth No.: {{tooth_or_site}}', content, flags=re.IGNORECASE)
-        # Pattern: "Tooth #: ___" with underscores
-        content = re.sub(r'Tooth\s*#\s*:\s*_+', 'Tooth #: {{tooth_or_site}}', content, flags=re.IGNORECASE)
-        
-        # Replace patient name placeholders - match various patterns with or without underscores
-        # Pattern: "Patient name: ___" with underscores first (most specific)
-        content = re.sub(r'Patient\s+[Nn]ame\s*:\s*_+', 'Patient Name: {{patient_name}}', content, flags=re.IGNORECASE)
-        # Pattern: "Patient Name:" without underscores (avoid replacing already replaced text)
-        content = re.sub(r'Patient\s+[Nn]ame\s*:(?!\s*\{\{)', 'Patient Name: {{patient_name}}', content, flags=re.IGNORECASE)
-        # Pattern: "Patient's Name:" (with apostrophe-s) - match with or without underscores/tabs
-        content = re.sub(r"Patient['\u2019]s\s+Name\s*:\s*[\s\t_]*", 'Patient\'s Name: {{patient_name}}', content, flags=re.IGNORECASE)
-        content = re.sub(r"Patient['\u2019]s\s+Name\s*:(?!\s*\{\{)", 'Patient\'s Name: {{patient_name}}', content, flags=re.IGNORECASE)
-        
-        # Pattern: "I, _____(print name)" or similar variations
-        content = re.sub(r'\b[Ii],?\s+_+\s*\(?\s*print\s+name\s*\)?', 'I, {{patient_name}} (print name)', content, flags=re.IGNORECASE)
-        
-        # Replace DOB placeholders - match various patterns with or without underscores
-        # Pattern: "DOB: ___" with underscores first (most specific)
-        content = re.sub(r'DOB\s*:\s*_+', 'DOB: {{patient_dob}}', content, flags=re.IGNORECASE)
-        # Pattern: "DOB:" without underscores (avoid replacing already replaced text)
-        content = re.sub(r'DOB\s*:(?!\s*\{\{)', 'DOB: {{patient_dob}}', content, flags=re.IGNORECASE)
-        
-        # Replace Date of Birth placeholders - match various patterns with or without underscores
-        # Pattern: "Date of Birth: ___" with underscores first (most specific)
-        content = re.sub(r'Date\s+of\s+Birth\s*:\s*_+', 'Date of Birth: {{patient_dob}}', content, flags=re.IGNORECASE)
-        # Pattern: "Date of Birth:" without underscores (avoid replacing already replaced text)
-        content = re.sub(r'Date\s+of\s+Birth\s*:(?!\s*\{\{)', 'Date of Birth: {{patient_dob}}', content, flags=re.IGNORECASE)
-        
-        # Replace Planned Procedure placeholders - match various patterns with or without underscores
-        # Pattern: "Planned Procedure: ___" with underscores first (most specific)
-        content = re.sub(r'Planned\s+Procedure\s*:\s*_+', 'Planned Procedure: {{planned_procedure}}', content, flags=re.IGNORECASE)
-        # Pattern: "Planned Procedure:" without underscores (avoid replacing already replaced text)
-        content = re.sub(r'Planned\s+Procedure\s*:(?!\s*\{\{)', 'Planned Procedure: {{planned_procedure}}', content, flags=re.IGNORECASE)
-        
-        # Replace Diagnosis placeholders - match various patterns with or without underscores
-        # Pattern: "Diagnosis: ___" with underscores first (most specific)
-        content = re.sub(r'Diagnosis\s*:\s*_+', 'Diagnosis: {{diagnosis}}', content, flags=re.IGNORECASE)
-        # Pattern: "Diagnosis:" without underscores (avoid replacing already replaced text)
-        content = re.sub(r'Diagnosis\s*:(?!\s*\{\{)', 'Diagnosis: {{diagnosis}}', content, flags=re.IGNORECASE)
-        
-        # Replace Alternative Treatment placeholders - match various patterns with or without underscores
-        # Pattern: "Alternative Treatment: ___" with underscores first (most specific)
-        content = re.sub(r'Alternative\s+Treatment\s*:\s*_+', 'Alternative Treatment: {{alternative_treatment}}', content, flags=re.IGNORECASE)
-        # Pattern: "Alternative Treatment:" without underscores (avoid replacing already replaced text)
-        content = re.sub(r'Alternative\s+Treatment\s*:(?!\s*\{\{)', 'Alternative Treatment: {{alternative_treatment}}', content, flags=re.IGNORECASE)
-        
-        # Replace standalone Date placeholders (not Date of Birth or Date Signed)
-        # Pattern: "Date: ___" with underscores first (most specific)
-        content = re.sub(r'(?<!of\s)(?<!Birth\s)(?<!Signed\s)Date\s*:\s*_+', 'Date: {{today_date}}', content, flags=re.IGNORECASE)
-        # Pattern: "Date:" without underscores (avoid replacing already replaced text and Date of Birth/Date Signed)
-        content = re.sub(r'(?<!of\s)(?<!Birth\s)(?<!Signed\s)Date\s*:(?!\s*\{\{)', 'Date: {{today_date}}', content, flags=re.IGNORECASE)
+        # Replace blank Dr./tooth/patient/date/procedure fields with their placeholders
+        for pattern, placeholder in self.PLACEHOLDER_SUBSTITUTIONS:
+            content = pattern.sub(placeholder, content)
         
         # Strip witness and doctor signatures from content
         content = self._remove_witness_and_doctor_signatures(content)
@@ -921,61 +956,51 @@ class ConsentFormFieldExtractor:
         
         return html_content, title
     
+    @staticmethod
+    def _is_bullet_line(line_text: str) -> bool:
+        """Check if a stripped line starts with a bullet marker (-, • or \uf0b7) followed by whitespace"""
+        return len(line_text) > 1 and line_text[0] in '-•\uf0b7' and line_text[1].isspace()
+    
     def _clean_markdown_formatting(self, text: str) -> str:
         """Clean markdown formatting artifacts from text and convert to HTML"""
         
         # Remove standalone # or ## or ### markers (empty headers)
-        text = re.sub(r'^#+\s*$', '', text.strip())
+        text = self.EMPTY_MARKDOWN_HEADER_RE.sub('', text.strip())
         
         # Convert ### headers to strong tags
-        text = re.sub(r'^###\s+(.+)$', r'<strong>\1</strong>', text)
+        text = self.MARKDOWN_H3_RE.sub(r'<strong>\1</strong>', text)
         
         # Convert ## headers to strong tags
-        text = re.sub(r'^##\s+(.+)$', r'<strong>\1</strong>', text)
+        text = self.MARKDOWN_H2_RE.sub(r'<strong>\1</strong>', text)
         
         # Convert **bold** to <strong>bold</strong>
-        text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
+        text = self.MARKDOWN_BOLD_RE.sub(r'<strong>\1</strong>', text)
         
         # Clean any remaining standalone # or ## markers within text
-        text = re.sub(r'\s*#+\s*', ' ', text)
+        text = self.MARKDOWN_HASH_RUN_RE.sub(' ', text)
         
         return text.strip()
     
     def _remove_practice_header_footer(self, content: str) -> str:
         """Remove practice header/footer information"""
         
-        practice_patterns = [
-            r'www\.\w+\.com',
-            r'\w+@\w+\.com',
-            r'\(\d{3}\)\d{3}-?\d{4}',
-            r'\d+\s+[A-Z][A-Za-z\s]+,\s+[A-Z]{2}\s+\d{5}',
-            r'Route\s+\d+.*\d{5}',
-            r'Smile@.*\.com',
-        ]
-        
-        for pattern in practice_patterns:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE)
+        for pattern in self.PRACTICE_INFO_PATTERNS:
+            content = pattern.sub('', content)
         
         # Clean up extra whitespace
-        content = re.sub(r'\s+', ' ', content).strip()
+        content = self.WHITESPACE_RUN_RE.sub(' ', content).strip()
         
         return content
     
     def _detect_consent_title(self, content: str) -> Optional[str]:
         """Detect consent form title from content"""
         
-        title_patterns = [
-            r'Informed\s+Consent\s+for\s+([^.]+)',
-            r'Consent\s+for\s+([^.]+)',
-            r'([^.]*Consent[^.]*)',
-        ]
-        
-        for pattern in title_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in self.CONSENT_TITLE_PATTERNS:
+            match = pattern.search(content)
             if match:
                 title = match.group(1).strip()
                 # Clean up the title
-                title = re.sub(r'\s+', ' ', title)
+                title = self.WHITESPACE_RUN_RE.sub(' ', title)
                 return title
         
         return None
@@ -984,10 +1009,10 @@ class ConsentFormFieldExtractor:
         """Split content into logical paragraphs for better HTML formatting"""
         
         # Split on sentence boundaries and common section markers
-        sections = re.split(r'(?:\.\s+|\n\s*\n)', content)
+        sections = self.PARAGRAPH_BREAK_RE.split(content)
         
         paragraphs = []
-        current_para = ""
+        current_paragraph = []
         
         for section in sections:
             section = section.strip()
@@ -995,16 +1020,16 @@ class ConsentFormFieldExtractor:
                 continue
             
             # If section is very short, combine with current paragraph
-            if len(section) < 50 and current_para:
-                current_para += " " + section
+            if len(section) < 50 and current_paragraph:
+                current_paragraph.append(section)
             else:
-                if current_para:
-                    paragraphs.append(current_para)
-                current_para = section
+                if current_paragraph:
+                    paragraphs.append(' '.join(current_paragraph))
+                current_paragraph = [section]
         
         # Add final paragraph
-        if current_para:
-            paragraphs.append(current_para)
+        if current_paragraph:
+            paragraphs.append(' '.join(current_paragraph))
         
         return paragraphs
 
@@ -14,21 +14,42 @@ class ConsentShapingManager:
     
     # Patterns that indicate consent paragraph content
     CONSENT_PATTERNS = [
-        r'.*I understand.*',
-        r'.*I acknowledge.*',
-        r'.*I agree.*',
-        r'.*I consent.*',
-        r'.*I authorize.*',
-        r'.*I have been.*informed.*',
-        r'.*risks.*benefits.*',
-        r'.*alternative.*treatment.*',
-        r'.*financial.*responsibility.*',
-        r'.*informed.*consent.*',
+        r'I understand',
+        r'I acknowledge',
+        r'I agree',
+        r'I consent',
+        r'I authorize',
+        r'I have been.*informed',
+        r'risks.*benefits',
+        r'alternative.*treatment',
+        r'financial.*responsibility',
+        r'informed.*consent',
     ]
+    # All consent patterns as one alternation, so a text is scanned once
+    CONSENT_PATTERN_RE = re.compile('|'.join(CONSENT_PATTERNS), re.IGNORECASE)
+    
+    # Keywords counted by consent-content detection; two or more mark consent content
+    CONSENT_KEYWORDS = (
+        'consent', 'acknowledge', 'understand', 'agree', 'authorize',
+        'risks', 'benefits', 'complications', 'treatment', 'procedure'
+    )
+    
+    # Line markers for detect_consent_sections ('sign' also covers 'signature' and 'date signed')
+    PATIENT_INFO_MARKER_RE = re.compile(r'patient name|name:|patient info')
+    PROCEDURE_MARKER_RE = re.compile(r'procedure|treatment|surgery')
+    
+    # Consent-form indicators for titles/sections and for text-field HTML (matched on lowercased text)
+    CONSENT_HEADING_RE = re.compile(r'consent|agreement|authorization')
+    CONSENT_TEXT_RE = re.compile(r'consent|understand|acknowledge|agree')
+    
+    # Whitespace and punctuation fixes applied by format_consent_text
+    WHITESPACE_RUN_RE = re.compile(r'\s+')
+    SENTENCE_GAP_RE = re.compile(r'\.(\w)')
+    SPACE_BEFORE_PUNCTUATION_RE = re.compile(r'\s+([,.;:!?])')
     
     def __init__(self):
         """Initialize the consent shaping manager"""
-        self.compiled_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.CONSENT_PATTERNS]
+        pass
     
     def apply_consent_shaping(self, spec: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -40,18 +61,20 @@ class ConsentShapingManager:
         Returns:
             List of field dictionaries with properly shaped consent elements
         """
+        # Partition out the text fields once; both the formatting and the form check use them
+        text_fields = [field for field in spec if field.get('type') == 'text']
+        
         # Look for consent-related text fields and ensure proper formatting
-        for field in spec:
-            if field.get('type') == 'text':
-                control = field.get('control', {})
-                html_text = control.get('html_text', '')
-                
-                if self._is_consent_content(html_text):
-                    # Apply consent-specific formatting
-                    field = self._format_consent_field(field)
+        for field in text_fields:
+            control = field.get('control', {})
+            html_text = control.get('html_text', '')
+            
+            if self._is_consent_content(html_text):
+                # Apply consent-specific formatting
+                field = self._format_consent_field(field)
         
         # Ensure proper consent form structure
-        spec = self._ensure_consent_structure(spec)
+        spec = self._ensure_consent_structure(spec, text_fields)
         
         return spec
     
@@ -61,18 +84,12 @@ class ConsentShapingManager:
             return False
         
         # Check against consent patterns
-        for pattern in self.compiled_patterns:
-            if pattern.search(text):
-                return True
+        if self.CONSENT_PATTERN_RE.search(text):
+            return True
         
         # Additional checks for consent keywords
-        consent_keywords = [
-            'consent', 'acknowledge', 'understand', 'agree', 'authorize',
-            'risks', 'benefits', 'complications', 'treatment', 'procedure'
-        ]
-        
         text_lower = text.lower()
-        keyword_count = sum(1 for keyword in consent_keywords if keyword in text_lower)
+        keyword_count = sum(1 for keyword in self.CONSENT_KEYWORDS if keyword in text_lower)
         
         # If multiple consent keywords are present, likely consent content
         return keyword_count >= 2
@@ -91,10 +108,10 @@ class ConsentShapingManager:
         
         return field
     
-    def _ensure_consent_structure(self, spec: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _ensure_consent_structure(self, spec: List[Dict[str, Any]], text_fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Ensure proper consent form structure with required elements"""
         # Check if this appears to be a consent form
-        if not self._is_consent_form(spec):
+        if not self._is_consent_form(spec, text_fields):
             return spec
         
         # Ensure signature elements are present for consent forms
@@ -102,33 +119,44 @@ class ConsentShapingManager:
         
         return spec
     
-    def _is_consent_form(self, spec: List[Dict[str, Any]]) -> bool:
-        """Determine if this specification represents a consent form"""
-        # Look for consent indicators
+    def _is_consent_form(self, spec: List[Dict[str, Any]], text_fields: List[Dict[str, Any]]) -> bool:
+        """Determine if this specification represents a consent form (text_fields: its text-type fields)"""
+        # Look for consent indicators; multiple indicators mean a likely consent form,
+        # so stop counting as soon as the second one is seen
         consent_indicators = 0
         
+        # Check field titles and sections
         for field in spec:
-            # Check field titles and text content
             title = field.get('title', '').lower()
             section = field.get('section', '').lower()
             
-            if any(word in title or word in section for word in ['consent', 'agreement', 'authorization']):
+            if self.CONSENT_HEADING_RE.search(title) or self.CONSENT_HEADING_RE.search(section):
                 consent_indicators += 1
-            
-            # Check text field content
-            if field.get('type') == 'text':
-                control = field.get('control', {})
-                html_text = control.get('html_text', '').lower()
-                if any(word in html_text for word in ['consent', 'understand', 'acknowledge', 'agree']):
-                    consent_indicators += 1
-        
-        # If we have multiple consent indicators, likely a consent form
-        return consent_indicators >= 2
+                if consent_indicators >= 2:
+                    return True
+        
+        # Check text field content
+        for field in text_fields:
+            control = field.get('control', {})
+            html_text = control.get('html_text', '').lower()
+            if self.CONSENT_TEXT_RE.search(html_text):
+                consent_indicators += 1
+                if consent_indicators >= 2:
+                    return True
+        
+        return False
     
     def _ensure_consent_signature_elements(self, spec: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Ensure consent forms have proper signature elements"""
-        has_signature = any(field.get('type') == 'signature' for field in spec)
-        has_date = any(field.get('key') == 'date_signed' for field in spec)
+        # One pass for both checks, stopping once both elements are seen
+        has_signature = has_date = False
+        for field in spec:
+            if field.get('type') == 'signature':
+                has_signature = True
+            if field.get('key') == 'date_signed':
+                has_date = True
+            if has_signature and has_date:
+                break
         
         if not has_signature:
             # Add signature field
@@ -184,15 +212,15 @@ class ConsentShapingManager:
                 })
             
             # Detect signature section
-            if any(word in line_lower for word in ['signature', 'sign', 'date signed']):
+            if 'sign' in line_lower:
                 sections['signature_section'] = True
             
             # Detect patient information section
-            if any(word in line_lower for word in ['patient name', 'name:', 'patient info']):
+            if self.PATIENT_INFO_MARKER_RE.search(line_lower):
                 sections['patient_info_section'] = True
             
             # Detect procedure section
-            if any(word in line_lower for word in ['procedure', 'treatment', 'surgery']):
+            if self.PROCEDURE_MARKER_RE.search(line_lower):
                 sections['procedure_section'] = True
         
         return sections
@@ -204,12 +232,12 @@ class ConsentShapingManager:
         
         # Clean up common formatting issues in consent text
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = self.WHITESPACE_RUN_RE.sub(' ', text).strip()
         
         # Ensure proper sentence spacing
-        text = re.sub(r'\.(\w)', r'. \1', text)
+        text = self.SENTENCE_GAP_RE.sub(r'. \1', text)
         
         # Fix common punctuation issues
-        text = re.sub(r'\s+([,.;:!?])', r'\1', text)
+        text = self.SPACE_BEFORE_PUNCTUATION_RE.sub(r'\1', text)
         
         return text
\ No newline at end of file
@@ -7,6 +7,7 @@ and consistent formatting across different form types.
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import List, Dict, Any
 
 
@@ -26,6 +27,26 @@ class FieldNormalizationManager:
         'printed_patient_name': 'printed_name',
     }
     
+    # Phone fields whose reference output carries hint: None instead of a context hint
+    NULL_HINT_KEYS = frozenset({'mobile_2', 'home_2', 'work_2', 'phone_2'})
+    
+    # Field types that never carry a hint in the reference output
+    HINTLESS_FIELD_TYPES = frozenset({'states', 'text'})
+    
+    # Text-field control keys, in the order they are emitted
+    TEXT_CONTROL_KEYS = ('temporary_html_text', 'html_text', 'text')
+    
+    # Default agreement paragraph for the benefits-authorization field
+    FINANCIAL_AGREEMENT_HTML = '<p>I have read the above and agree to the financial and scheduling terms.</p>'
+    
+    # Character map for non-text_3 HTML: drop the \uf071 glyph and straighten smart quotes
+    SMART_PUNCTUATION_TRANSLATION = str.maketrans({'\uf071': None, '\u2019': "'", '\u201c': '"', '\u201d': '"'})
+    
+    # Per-field cleanup patterns for HTML text, titles and key slugs
+    ESCAPED_UNICODE_RE = re.compile(r'\\u[0-9a-fA-F]{4}')
+    HIGH_CODEPOINT_RE = re.compile(r'[\uf000-\uffff]')
+    SLUG_SEPARATOR_RE = re.compile(r"[^a-zA-Z0-9]+")
+    
     def __init__(self):
         """Initialize the field normalization manager"""
         pass
@@ -43,12 +64,11 @@ class FieldNormalizationManager:
         for item in spec:
             if "key" in item:
                 original_key = item["key"]
-                normalized_key = original_key
                 
                 # Apply direct mappings first
-                if original_key in self.DIRECT_KEY_MAPPINGS:
-                    normalized_key = self.DIRECT_KEY_MAPPINGS[original_key]
-                else:
+                normalized_key = self.DIRECT_KEY_MAPPINGS.get(original_key)
+                if normalized_key is None:
+                    normalized_key = original_key
                     # Apply regex normalization patterns
                     for pattern, replacement in self.KEY_NORMALIZATIONS.items():
                         normalized_key = re.sub(pattern, replacement, normalized_key)
@@ -80,8 +100,6 @@ class FieldNormalizationManager:
     
     def _normalize_control_by_type(self, control: Dict[str, Any], field_type: str, field_key: str) -> Dict[str, Any]:
         """Normalize control structure based on field type"""
-        normalized_control = {}
-        
         if field_type == "states":
             # States fields have empty control per schema
             return {}
@@ -90,21 +108,14 @@ class FieldNormalizationManager:
             return {}
         elif field_type == 'text':
             # For text fields: temporary_html_text, html_text, text
-            if 'temporary_html_text' in control and control['temporary_html_text'] is not None:
-                normalized_control['temporary_html_text'] = control['temporary_html_text']
-            if 'html_text' in control and control['html_text'] is not None:
-                normalized_control['html_text'] = control['html_text']
-            if 'text' in control and control['text'] is not None:
-                normalized_control['text'] = control['text']
+            normalized_control = {key: control[key] for key in self.TEXT_CONTROL_KEYS
+                                  if control.get(key) is not None}
             # Add any other non-null fields
-            for key, value in control.items():
-                if key not in ['temporary_html_text', 'html_text', 'text'] and value is not None:
-                    normalized_control[key] = value
+            normalized_control.update({key: value for key, value in control.items()
+                                       if key not in self.TEXT_CONTROL_KEYS and value is not None})
         else:
             # For other fields: only add non-null values per schema
-            for key, value in control.items():
-                if value is not None:
-                    normalized_control[key] = value
+            normalized_control = {key: value for key, value in control.items() if value is not None}
         
         # Apply specific field fixes
         normalized_control = self._apply_specific_field_fixes(normalized_control, field_type, field_key)
@@ -118,15 +129,12 @@ class FieldNormalizationManager:
             control["input_type"] = "address"
         
         # Fix phone fields that should have hint: None instead of context hints
-        if field_key in ["mobile_2", "home_2", "work_2", "phone_2"]:
+        if field_key in self.NULL_HINT_KEYS:
             control["hint"] = None
         
-        # Fix initials fields to not have hint in reference
-        if field_key == "initials_3":
-            control.pop("hint", None)
-        
-        # Remove hint field from specific field types that don't have it in reference
-        if field_type in ['states', 'text'] or field_key.startswith('initials'):
+        # Remove hint field from specific field types that don't have it in reference,
+        # and from initials fields (initials, initials_2, initials_3, ...)
+        if field_type in self.HINTLESS_FIELD_TYPES or field_key.startswith('initials'):
             control.pop("hint", None)
         
         return control
@@ -160,15 +168,14 @@ class FieldNormalizationManager:
                 # Remove escaped underscores
                 text = text.replace('\\_', '')
                 
-                # For text_3 field (NPF patient responsibilities), preserve \uf071 character
-                if field_key == 'text_3':
-                    # Only remove escaped unicode sequences, but preserve actual unicode characters like \uf071 and smart quotes
-                    text = re.sub(r'\\u[0-9a-fA-F]{4}', '', text)
-                    # DO NOT convert smart quotes or remove \uf071 for text_3 field - preserve reference formatting exactly
-                else:
+                # Remove escaped unicode sequences
+                text = self.ESCAPED_UNICODE_RE.sub('', text)
+                
+                # For text_3 field (NPF patient responsibilities), preserve actual unicode characters
+                # like \uf071 and smart quotes - preserve reference formatting exactly
+                if field_key != 'text_3':
                     # Remove Unicode characters like \uf071, \u2019, \u201c, \u201d for other fields
-                    text = re.sub(r'\\u[0-9a-fA-F]{4}', '', text)
-                    text = text.replace('\uf071', '').replace('\u2019', "'").replace('\u201c', '"').replace('\u201d', '"')
+                    text = text.translate(self.SMART_PUNCTUATION_TRANSLATION)
                 
                 # Clean up extra spaces
                 text = ' '.join(text.split())
@@ -183,9 +190,7 @@ class FieldNormalizationManager:
     def _normalize_title(self, title: str) -> str:
         """Normalize field titles by removing unwanted characters"""
         # Remove Unicode characters like \uf071
-        title = re.sub(r'[\uf000-\uffff]', '', title)
-        title = title.replace('\uf071', '').rstrip()
-        return title
+        return self.HIGH_CODEPOINT_RE.sub('', title).rstrip()
     
     def normalize_authorization_field(self, spec: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -204,8 +209,8 @@ class FieldNormalizationManager:
                 # Clean up authorization field control - should only have options
                 control = field.get('control', {})
                 options = control.get('options', [])
-                html_text = control.get('html_text', '<p>I have read the above and agree to the financial and scheduling terms.</p>')
-                temp_html_text = control.get('temporary_html_text', '<p>I have read the above and agree to the financial and scheduling terms.</p>')
+                html_text = control.get('html_text', self.FINANCIAL_AGREEMENT_HTML)
+                temp_html_text = control.get('temporary_html_text', self.FINANCIAL_AGREEMENT_HTML)
                 field['control'] = {
                     'temporary_html_text': temp_html_text,
                     'html_text': html_text,
@@ -217,6 +222,7 @@ class FieldNormalizationManager:
         return spec
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def slugify(text: str, fallback: str = "field") -> str:
         """Convert text to a valid key slug"""
         if not text or not text.strip():
@@ -227,6 +233,6 @@ class FieldNormalizationManager:
         text = "".join(ch for ch in text if not unicodedata.combining(ch))
         
         # Replace non-alphanumeric with underscores and lowercase
-        text = re.sub(r"[^a-zA-Z0-9]+", "_", text).strip("_").lower()
+        text = FieldNormalizationManager.SLUG_SEPARATOR_RE.sub("_", text).strip("_").lower()
         
         return text or fallback
\ No newline at end of file
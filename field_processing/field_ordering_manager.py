@@ -5,11 +5,11 @@ Handles the ordering and sequencing of form fields to ensure consistent output
 that matches reference standards.
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldInfo:
     """Information about a detected form field"""
     key: str
@@ -48,6 +48,8 @@ class FieldOrderingManager:
         "i_authorize_the_release_of_my_personal_information_necessary_to_process_my_dental_benefit_claims,_including_health_information,_",
         "initials_3", "signature", "date_signed"
     ]
+    REFERENCE_FIELD_KEYS = frozenset(REFERENCE_FIELD_ORDER)
+    REFERENCE_FIELD_INDEX = {key: index for index, key in enumerate(REFERENCE_FIELD_ORDER)}
     
     def __init__(self):
         """Initialize the field ordering manager"""
@@ -66,57 +68,48 @@ class FieldOrderingManager:
         # Sort by line_idx first to preserve document order
         fields.sort(key=lambda f: getattr(f, 'line_idx', 0))
         
+        # Key lookup shared by the overlap check and the reference ordering
+        field_lookup = {field.key: field for field in fields}
+        
         # If we have a reference order to follow, apply it
-        if self._should_use_reference_ordering(fields):
-            return self._apply_reference_ordering(fields)
+        if self._should_use_reference_ordering(field_lookup):
+            return self._apply_reference_ordering(fields, field_lookup)
         
         # Otherwise maintain document order with signature fields at end
         return self._apply_standard_ordering(fields)
     
-    def _should_use_reference_ordering(self, fields: List[FieldInfo]) -> bool:
+    def _should_use_reference_ordering(self, field_lookup: Dict[str, FieldInfo]) -> bool:
         """
         Determine if we should use the reference ordering pattern.
         
         This is typically for comprehensive forms like NPF that match the reference structure.
         """
-        field_keys = {field.key for field in fields}
-        reference_keys = set(self.REFERENCE_FIELD_ORDER)
-        
         # If we have a significant overlap with reference keys, use reference ordering
-        overlap = len(field_keys.intersection(reference_keys))
-        return overlap > len(field_keys) * 0.5  # More than 50% overlap
+        overlap = len(self.REFERENCE_FIELD_KEYS.intersection(field_lookup))
+        return overlap > len(field_lookup) * 0.5  # More than 50% overlap
     
-    def _apply_reference_ordering(self, fields: List[FieldInfo]) -> List[FieldInfo]:
-        """Apply the reference field ordering"""
-        field_lookup = {field.key: field for field in fields}
-        ordered_fields = []
+    def _apply_reference_ordering(self, fields: List[FieldInfo], field_lookup: Dict[str, FieldInfo]) -> List[FieldInfo]:
+        """Apply the reference field ordering using the key lookup built by order_fields"""
         
-        # Add fields in reference order
-        for key in self.REFERENCE_FIELD_ORDER:
-            if key in field_lookup:
-                ordered_fields.append(field_lookup[key])
+        # Add fields in reference order (walk the detected keys, not the whole reference list)
+        reference_index = self.REFERENCE_FIELD_INDEX
+        ordered_fields = sorted(
+            (field for key, field in field_lookup.items() if key in reference_index),
+            key=lambda field: reference_index[field.key]
+        )
         
         # Add any remaining fields that aren't in the reference order
         for field in fields:
-            if field.key not in self.REFERENCE_FIELD_ORDER:
+            if field.key not in self.REFERENCE_FIELD_KEYS:
                 ordered_fields.append(field)
         
         return ordered_fields
     
     def _apply_standard_ordering(self, fields: List[FieldInfo]) -> List[FieldInfo]:
         """Apply standard ordering for forms that don't match reference pattern"""
-        # Group fields by type with signatures at the end
-        signature_fields = []
-        other_fields = []
-        
-        for field in fields:
-            if field.field_type == 'signature':
-                signature_fields.append(field)
-            else:
-                other_fields.append(field)
-        
-        # Return non-signature fields followed by signature fields
-        return other_fields + signature_fields
+        # Return non-signature fields followed by signature fields; the sort is stable,
+        # so document order is kept within each group
+        return sorted(fields, key=lambda field: field.field_type == 'signature')
     
     def ensure_required_signature_fields(self, fields: List[FieldInfo]) -> List[FieldInfo]:
         """
@@ -150,9 +143,15 @@ class FieldOrderingManager:
         
         return fields
     
-    def ensure_date_signed_field(self, fields: List[FieldInfo]) -> List[FieldInfo]:
-        """Ensure date_signed field is present if signature exists"""
-        has_signature = any(f.field_type == 'signature' for f in fields)
+    def ensure_date_signed_field(self, fields: List[FieldInfo], has_signature: Optional[bool] = None) -> List[FieldInfo]:
+        """
+        Ensure date_signed field is present if signature exists.
+        
+        Callers that already know whether a signature field is present (e.g. right after
+        ensure_required_signature_fields) can pass has_signature to skip rescanning.
+        """
+        if has_signature is None:
+            has_signature = any(f.field_type == 'signature' for f in fields)
         has_date_signed = any(f.key == 'date_signed' for f in fields)
         
         if has_signature and not has_date_signed:
@@ -173,9 +173,9 @@ class ModularDocumentToJSONConverter:
         """Process fields using the new field processing managers"""
         from field_processing import FieldInfo
         
-        # Ensure required signature fields are present
+        # Ensure required signature fields are present (this guarantees a signature field for the date check)
         fields = self.field_ordering_manager.ensure_required_signature_fields(fields)
-        fields = self.field_ordering_manager.ensure_date_signed_field(fields)
+        fields = self.field_ordering_manager.ensure_date_signed_field(fields, has_signature=True)
         
         # Order fields properly
         fields = self.field_ordering_manager.order_fields(fields)
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Test the table-driven extraction helpers in pdf_to_json_converter.py and consent_converter.py
+
+This test validates that:
+1. RADIO_QUESTION_RULES gives the same titles/options as the old inline radio patterns
+2. split_checkbox_question returns what the old checkbox question regex captured
+3. build_line_sections matches the old per-line section walk
+4. match_standalone_label finds exact and apostrophe-normalized labels
+5. CONSENT_TITLE_LINE_RE picks the same title shape as the old chain of regexes
+6. Controls copied from the shared field templates do not write back into them
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Add the parent directory to the path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pdf_to_json_converter import DocumentFormFieldExtractor
+from consent_converter import ConsentFormFieldExtractor
+
+
+def test_radio_question_rules():
+    """Test that radio question lines map to the reference titles and options"""
+    print("Testing radio question rule table...")
+
+    extractor = DocumentFormFieldExtractor()
+
+    cases = [
+        ("Sex: Male Female", 'Sex'),
+        ("Marital Status (circle one)", 'Marital Status'),
+        ("Is the patient a minor?", 'Is the Patient a Minor?'),
+        ("Full time student", 'Full-time Student'),
+        ("What is your preferred method of contact?", 'What Is Your Preferred Method Of Contact'),
+        ("Relationship to patient: Self Spouse Parent Other", 'Relationship To Patient'),
+        ("If patient is a minor, primary residence", 'If Patient Is A Minor, Primary Residence'),
+        # Rules are tried in order: sex wins over the later marital status rule
+        ("Sex Male Female Marital Status", 'Sex'),
+        # Relationship needs one of the listed options after it
+        ("Relationship to patient", None),
+        ("First Name", None),
+    ]
+
+    for line, expected_title in cases:
+        result = extractor.detect_radio_question(line)
+        title = result[0] if result else None
+        assert title == expected_title, f"{line!r}: expected {expected_title!r}, got {title!r}"
+
+    _, options = extractor.detect_radio_question("Sex: Male Female")
+    assert options == [{"name": "Male", "value": "male"}, {"name": "Female", "value": "female"}]
+    _, options = extractor.detect_radio_question("Is the patient a minor?")
+    assert options == [{"name": "Yes", "value": True}, {"name": "No", "value": False}]
+    print("✓ Radio question titles and options match the reference")
+
+    # Returned options must not alias the rule table
+    options[0]["value"] = "changed"
+    _, options = extractor.detect_radio_question("Is the patient a minor?")
+    assert options[0]["value"] is True, "Changing returned options must not change RADIO_QUESTION_RULES"
+    assert DocumentFormFieldExtractor.YES_NO_OPTIONS[0]["value"] is True
+    print("✓ Returned radio options are independent copies")
+
+
+def test_split_checkbox_question():
+    """Test that split_checkbox_question returns the old regex's question group"""
+    print("Testing checkbox question splitting...")
+
+    extractor = DocumentFormFieldExtractor()
+    old_pattern = re.compile(r'([^□☐!]+?)(?:□|☐|!)([^□☐!]+?)(?:□|☐|!)')
+
+    lines = [
+        "Primary residence □ Both Parents □ Mom □ Dad",
+        "Sex ☐ Male ☐ Female",
+        "Do you smoke? ! Yes ! No",
+        "□ Yes □ No",
+        "Question □□ Yes □",
+        "Mixed ☐ one □ two ! three",
+        "No boxes at all",
+        "Only one □ box",
+        "",
+    ]
+
+    for line in lines:
+        match = old_pattern.search(line)
+        expected = match.group(1) if match else None
+        assert extractor.split_checkbox_question(line) == expected, \
+            f"{line!r}: expected {expected!r}, got {extractor.split_checkbox_question(line)!r}"
+
+    print("✓ Checkbox question text matches the old regex")
+
+
+def test_build_line_sections():
+    """Test that build_line_sections matches walking the header dict for each line"""
+    print("Testing line section map...")
+
+    extractor = DocumentFormFieldExtractor()
+
+    def old_section_walk(line_idx, sections, default="Patient Information Form"):
+        current_section = default
+        for section_line, section_name in sections.items():
+            if section_line <= line_idx:
+                current_section = section_name
+            else:
+                break
+        return current_section
+
+    text_lines = [
+        "## Patient Information",
+        "First Name ____",
+        "## Medical History",
+        "Allergies ____",
+        "## For Children/Minors Only",
+        "Guardian ____",
+        "Signature ____",
+    ]
+    sections = extractor.detect_section_headers_universal(text_lines)
+    line_sections = extractor.build_line_sections(len(text_lines), sections)
+
+    assert line_sections == [old_section_walk(i, sections) for i in range(len(text_lines))]
+    assert line_sections[3] == "Medical History"
+    assert line_sections[5] == "FOR CHILDREN/MINORS ONLY"
+
+    # Lines before the first header fall back to the default section
+    line_sections = extractor.build_line_sections(3, {2: "Signature"}, default="Intro")
+    assert line_sections == ["Intro", "Intro", "Signature"]
+    print("✓ Line section map matches the per-line walk")
+
+
+def test_match_standalone_label():
+    """Test standalone label lookup against the extraction tables"""
+    print("Testing standalone label matching...")
+
+    extractor = DocumentFormFieldExtractor()
+    fields = extractor.PATIENT_INFO_STANDALONE_LABEL_FIELDS
+
+    assert extractor.match_standalone_label("Marital Status", fields) == "Marital Status"
+    assert extractor.match_standalone_label("Sex", fields) == "Sex"
+    # "Today 's Date" has its own entry; the spaced apostrophe also normalizes onto it
+    assert extractor.match_standalone_label("Today 's Date", fields) == "Today 's Date"
+    assert extractor.match_standalone_label("Today's Date", fields) == "Today's Date"
+    assert extractor.match_standalone_label("Date Signed", extractor.UNIVERSAL_STANDALONE_LABEL_FIELDS) is None
+    assert extractor.match_standalone_label("marital status", fields) is None
+    assert extractor.match_standalone_label("Patient Name", fields) is None
+    print("✓ Standalone labels match exactly as before")
+
+
+def test_consent_title_line_shapes():
+    """Test that CONSENT_TITLE_LINE_RE picks the same shape as the old regex chain"""
+    print("Testing consent title line shapes...")
+
+    old_shapes = [
+        ('caps', re.compile(r'^[A-Z\s]+CONSENT[A-Z\s]*$')),
+        ('informed_for', re.compile(r'^Informed\s+Consent\s+for\s+', re.IGNORECASE)),
+        ('bold', re.compile(r'^\*\*(.+)\*\*$')),
+        ('informed', re.compile(r'^.+\s+Informed\s+Consent\s*$', re.IGNORECASE)),
+        ('refusal', re.compile(r'^.+\s+[Rr]efusal\s*$', re.IGNORECASE)),
+    ]
+
+    lines = [
+        "TOOTH REMOVAL CONSENT FORM",
+        "Informed Consent for Crown And Bridge Prosthetics",
+        "INFORMED CONSENT FOR IMPLANTS",
+        "**Olympia Hills Family Dental Warranty Document**",
+        "**CONSENT**",
+        "Labial Frenectomy Informed Consent",
+        "Informed refusal",
+        "Treatment REFUSAL",
+        "Patient Name: ____",
+        "Consent",
+    ]
+
+    for line in lines:
+        expected = next((shape for shape, pattern in old_shapes if pattern.match(line)), None)
+        match = ConsentFormFieldExtractor.CONSENT_TITLE_LINE_RE.match(line)
+        shape = match.lastgroup if match else None
+        assert shape == expected, f"{line!r}: expected {expected!r}, got {shape!r}"
+
+    match = ConsentFormFieldExtractor.CONSENT_TITLE_LINE_RE.match("**Warranty Document**")
+    assert match.group('bold_text') == "Warranty Document"
+    print("✓ Consent title shapes match the old regex chain")
+
+
+def test_copy_template_control_isolation():
+    """Test that changing a copied control leaves the shared templates untouched"""
+    print("Testing template control copies...")
+
+    extractor = DocumentFormFieldExtractor()
+
+    # Read-only MappingProxyType controls come back as plain, writable dicts
+    control = extractor.copy_template_control(extractor.NAME_CONTROL)
+    control["input_type"] = "changed"
+    assert extractor.NAME_CONTROL["input_type"] == "name"
+
+    # Option lists and option dicts are copied too
+    _, _, _, marital_control = extractor.PATIENT_INFO_STANDALONE_LABEL_FIELDS['Marital Status']
+    control = extractor.copy_template_control(marital_control)
+    control["options"][0]["value"] = "changed"
+    control["options"].append({"name": "Other", "value": "other"})
+    assert marital_control["options"][0]["value"] == "Married"
+    assert len(marital_control["options"]) == 5
+
+    # Fields built from RECORDS_RELEASE_FIELD_TEMPLATES own their controls
+    fields = extractor.extract_records_release_fields([])
+    for field in fields:
+        for option in field.control.get("options", []):
+            option["value"] = "changed"
+        field.control["input_type"] = "changed"
+    for template in extractor.RECORDS_RELEASE_FIELD_TEMPLATES:
+        template_control = template[5]
+        assert template_control.get("input_type") != "changed"
+        for option in template_control.get("options", ()):
+            assert option["value"] != "changed"
+    assert extractor.PHONE_CONTROL["input_type"] == "phone"
+    print("✓ Shared template controls are unchanged")
+
+
+def main():
+    """Run all tests"""
+    print("=" * 70)
+    print("Testing extraction rule tables")
+    print("=" * 70)
+    print()
+
+    try:
+        test_radio_question_rules()
+        print()
+        test_split_checkbox_question()
+        print()
+        test_build_line_sections()
+        print()
+        test_match_standalone_label()
+        print()
+        test_consent_title_line_shapes()
+        print()
+        test_copy_template_control_isolation()
+        print()
+
+        print("=" * 70)
+        print("🎉 All tests passed!")
+    except AssertionError as e:
+        print(f"❌ Test failed: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Test error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()